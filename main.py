@@ -2,57 +2,404 @@ import sys
 import os
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QFileDialog, QTableWidget, QTableWidgetItem,
                              QVBoxLayout, QHBoxLayout, QWidget, QPushButton, QLabel, QProgressBar,
-                             QSplitter, QHeaderView, QComboBox)
+                             QSplitter, QHeaderView, QComboBox, QCheckBox, QMessageBox)
 from PyQt6.QtGui import QPixmap
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PIL import Image
-import piexif
+from PIL import Image, ImageQt
+import dbm
 import hashlib
+import io
+import mmap
+import shelve
+import struct
 import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.pcx'})
+FAST_HASH_SAMPLE_SIZE = 4096
+TABLE_BATCH_SIZE = 32
+HEADER_SIZE = 64 * 1024
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_MODES = {
+    (1, 0): ('1', '1'), (2, 0): ('L', 'L;2'), (4, 0): ('L', 'L;4'), (8, 0): ('L', 'L'), (16, 0): ('I;16', 'I;16B'),
+    (8, 2): ('RGB', 'RGB'), (16, 2): ('RGB', 'RGB;16B'),
+    (1, 3): ('P', 'P;1'), (2, 3): ('P', 'P;2'), (4, 3): ('P', 'P;4'), (8, 3): ('P', 'P'),
+    (8, 4): ('LA', 'LA'), (16, 4): ('RGBA', 'LA;16B'),
+    (8, 6): ('RGBA', 'RGBA'), (16, 6): ('RGBA', 'RGBA;16B')
+}
+PNG_RAWMODES = {rawmode: key for key, (mode, rawmode) in PNG_MODES.items()}
+THUMBNAIL_SIZE = (300, 300)
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+POOL_ATTEMPTS = 2
+CACHE_VERSION = 3
+CACHE_ERRORS = (*dbm.error, OSError)
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "image_analyzer", f"results-v{CACHE_VERSION}")
 
 
 class ImageAnalyzerThread(QThread):
     update_progress = pyqtSignal(int)
-    update_table = pyqtSignal(list)
+    update_table_batch = pyqtSignal(list)
+    files_skipped = pyqtSignal(int)
 
-    def __init__(self, file_paths):
+    def __init__(self, file_paths, fast_hash=False, file_stats=None):
         super().__init__()
         self.file_paths = file_paths
+        self.fast_hash = fast_hash
+        self.file_stats = file_stats or {}
 
     def run(self):
-        total_files = len(self.file_paths)
-        for i, file_path in enumerate(self.file_paths):
-            self.analyze_image(file_path)
-            self.update_progress.emit(int((i + 1) / total_files * 100))
+        self.batch = []
+        self.processed = 0
+        self.last_progress = -1
+        cache = self.open_cache()
+        try:
+            jobs = []
+            for file_path in self.file_paths:
+                try:
+                    st = self.file_stats.get(file_path) or os.stat(file_path)
+                    cache_key = self.get_cache_key(file_path)
+                    file_version = (st.st_mtime_ns, st.st_size)
+                    data = self.read_cache(cache, cache_key, file_version)
+                    if data is None:
+                        jobs.append((file_path, st, cache_key, file_version))
+                        continue
+                    data = data[:9] + self.get_file_times(st) + data[12:]
+                except Exception as e:
+                    print(f"Error analyzing {file_path}: {e}")
+                    data = None
+                self.add_result(data)
+            for _ in range(POOL_ATTEMPTS):
+                if not jobs:
+                    break
+                jobs = self.analyze_in_pool(jobs, cache)
+            if jobs:
+                print(f"Skipped {len(jobs)} files after the worker pool failed")
+                for _ in jobs:
+                    self.add_result(None)
+                self.files_skipped.emit(len(jobs))
+        finally:
+            try:
+                cache.close()
+            except CACHE_ERRORS as e:
+                print(f"Error closing cache {CACHE_PATH}: {e}")
+        if self.batch:
+            self.update_table_batch.emit(self.batch)
+
+    def analyze_in_pool(self, jobs, cache):
+        pending = {job[0]: job for job in jobs}
+        try:
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as executor:
+                futures = {executor.submit(self.analyze_image, file_path, st, self.fast_hash): file_path
+                           for file_path, st, _, _ in jobs}
+                for future in as_completed(futures):
+                    file_path = futures[future]
+                    try:
+                        data = future.result()
+                    except BrokenProcessPool:
+                        continue
+                    except Exception as e:
+                        print(f"Error analyzing {file_path}: {e}")
+                        data = None
+                    _, _, cache_key, file_version = pending.pop(file_path)
+                    if data is not None:
+                        self.write_cache(cache, cache_key, (file_version, data[:-1] + [None]))
+                    self.add_result(data)
+        except Exception as e:
+            print(f"Error running analysis: {e}")
+        if pending:
+            print(f"Worker pool failed with {len(pending)} files left to analyze")
+        return list(pending.values())
+
+    def add_result(self, data):
+        if data is not None:
+            self.batch.append(data)
+        if len(self.batch) >= TABLE_BATCH_SIZE:
+            self.update_table_batch.emit(self.batch)
+            self.batch = []
+        self.processed += 1
+        progress = int(self.processed / len(self.file_paths) * 100)
+        if progress != self.last_progress:
+            self.update_progress.emit(progress)
+            self.last_progress = progress
+
+    @classmethod
+    def open_cache(cls):
+        try:
+            os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+            cls.remove_stale_caches()
+            return shelve.open(CACHE_PATH)
+        except Exception as e:
+            print(f"Error opening cache {CACHE_PATH}: {e}")
+            return shelve.Shelf({})
 
-    def analyze_image(self, file_path):
+    @staticmethod
+    def remove_stale_caches():
+        cache_name = os.path.basename(CACHE_PATH)
+        with os.scandir(os.path.dirname(CACHE_PATH)) as entries:
+            for entry in entries:
+                stem = entry.name.split('.')[0]
+                if stem.startswith("results") and stem != cache_name:
+                    try:
+                        os.remove(entry.path)
+                    except OSError as e:
+                        print(f"Error removing stale cache {entry.path}: {e}")
+
+    @staticmethod
+    def read_cache(cache, cache_key, file_version):
         try:
-            with Image.open(file_path) as img:
-                filename = os.path.basename(file_path)
-                size = f"{img.width}x{img.height}"
-                format = img.format
-                mode = img.mode
-
-                dpi = img.info.get('dpi', (72, 72))
-                resolution = f"{dpi[0]}x{dpi[1]} dpi"
-
-                color_depth = self.get_color_depth(mode)
-                compression = img.info.get('compression', 'No info')
-                file_size = os.path.getsize(file_path)
-                file_size_mb = round(file_size / (1024 * 1024), 2)
-                file_hash = self.get_file_hash(file_path)
-
-                creation_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(os.path.getctime(file_path)))
-                modification_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(os.path.getmtime(file_path)))
-                access_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(os.path.getatime(file_path)))
-
-                additional_info = self.get_additional_info(img, format)
-
-                self.update_table.emit([filename, size, resolution, color_depth, str(compression), format,
-                                        additional_info, file_size_mb, file_hash,
-                                        creation_time, modification_time, access_time, file_path])
+            entry = cache.get(cache_key)
+        except Exception as e:
+            print(f"Error reading cache entry {cache_key}: {e}")
+            return None
+        if not (isinstance(entry, tuple) and len(entry) == 2 and entry[0] == file_version
+                and isinstance(entry[1], list) and len(entry[1]) == 14):
+            return None
+        return entry[1]
+
+    @staticmethod
+    def write_cache(cache, cache_key, data):
+        try:
+            cache[cache_key] = data
+        except CACHE_ERRORS as e:
+            print(f"Error writing cache entry {cache_key}: {e}")
+
+    def get_cache_key(self, file_path):
+        return f"{file_path}:{'fast' if self.fast_hash else 'full'}"
+
+    @classmethod
+    def analyze_image(cls, file_path, st, fast_hash=False):
+        try:
+            with open(file_path, "rb", buffering=0) as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                header = cls.read_header(mm)
+                if fast_hash:
+                    file_hash = cls.get_fast_file_hash(mm)
+                else:
+                    file_hash = cls.get_file_hash(mm)
+                try:
+                    thumbnail = cls.get_thumbnail_bytes(mm)
+                except (OSError, ValueError) as e:
+                    print(f"Error creating thumbnail for {file_path}: {e}")
+                    thumbnail = None
+
+            filename = os.path.basename(file_path)
+            size = f"{header['width']}x{header['height']}"
+            format = header['format']
+
+            dpi = header['dpi']
+            resolution = f"{dpi[0]}x{dpi[1]} dpi"
+
+            color_depth = cls.get_color_depth(header['mode'])
+            compression = header['compression']
+            file_size_mb = round(st.st_size / (1024 * 1024), 2)
+            additional_info = header['additional_info']
+
+            return [filename, size, resolution, color_depth, str(compression), format,
+                    additional_info, file_size_mb, file_hash] + cls.get_file_times(st) + [file_path, thumbnail]
         except Exception as e:
             print(f"Error analyzing {file_path}: {e}")
+            return None
+
+    @staticmethod
+    def get_file_times(st):
+        return [time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+                for timestamp in (st.st_ctime, st.st_mtime, st.st_atime)]
+
+    @classmethod
+    def read_header(cls, data):
+        head = data[:HEADER_SIZE]
+        header = None
+        try:
+            if head.startswith(PNG_SIGNATURE):
+                header = cls.read_png_header(head)
+            elif head.startswith(b'\xff\xd8'):
+                header = cls.read_jpeg_header(head)
+            elif head[:6] in (b'GIF87a', b'GIF89a'):
+                header = cls.read_gif_header(head)
+            elif head.startswith(b'BM'):
+                header = cls.read_bmp_header(head)
+        except struct.error:
+            header = None
+        return header or cls.read_pil_header(data)
+
+    @classmethod
+    def read_pil_header(cls, data):
+        data.seek(0)
+        with Image.open(data) as img:
+            return {
+                "format": img.format,
+                "width": img.width,
+                "height": img.height,
+                "mode": img.mode,
+                "dpi": img.info.get('dpi', (72, 72)),
+                "compression": img.info.get('compression', 'No info'),
+                "additional_info": cls.get_additional_info(img, img.format)
+            }
+
+    @staticmethod
+    def read_png_header(head):
+        offset = len(PNG_SIGNATURE)
+        header = None
+        while offset + 8 <= len(head):
+            length, chunk_type = struct.unpack('>I4s', head[offset:offset + 8])
+            data = head[offset + 8:offset + 8 + length]
+            if len(data) < length:
+                return None
+            if chunk_type == b'IHDR':
+                width, height, bit_depth, color_type = struct.unpack('>IIBB', data[:10])
+                if (bit_depth, color_type) not in PNG_MODES:
+                    return None
+                header = {
+                    "format": 'PNG',
+                    "width": width,
+                    "height": height,
+                    "mode": PNG_MODES[(bit_depth, color_type)][0],
+                    "dpi": (72, 72),
+                    "compression": 'No info',
+                    "additional_info": ImageAnalyzerThread.get_png_colors(color_type, bit_depth, 0)
+                }
+            elif header is None:
+                return None
+            elif chunk_type == b'pHYs':
+                px, py, unit = struct.unpack('>IIB', data[:9])
+                if unit == 1:
+                    header["dpi"] = (px * 0.0254, py * 0.0254)
+            elif chunk_type == b'PLTE' and color_type == 3:
+                header["additional_info"] = ImageAnalyzerThread.get_png_colors(color_type, bit_depth, length // 3)
+            elif chunk_type in (b'IDAT', b'IEND'):
+                return header
+            offset += length + 12
+        return None
+
+    @classmethod
+    def read_jpeg_header(cls, head):
+        offset = 2
+        dpi = None
+        exif = None
+        while offset + 4 <= len(head):
+            if head[offset] != 0xFF:
+                return None
+            marker = head[offset + 1]
+            if marker == 0xFF:
+                offset += 1
+                continue
+            if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+                offset += 2
+                continue
+            length = struct.unpack('>H', head[offset + 2:offset + 4])[0]
+            segment = head[offset + 4:offset + 2 + length]
+            if len(segment) < length - 2:
+                return None
+            if marker == 0xE0 and segment.startswith(b'JFIF') and dpi is None:
+                unit, x_density, y_density = struct.unpack('>BHH', segment[7:12])
+                if unit == 1:
+                    dpi = (x_density, y_density)
+                elif unit == 2:
+                    dpi = (x_density * 2.54, y_density * 2.54)
+            elif marker == 0xE1 and segment.startswith(b'Exif\x00\x00') and exif is None:
+                exif = segment
+            elif marker in JPEG_SOF_MARKERS:
+                height, width, components = struct.unpack('>HHB', segment[1:6])
+                if dpi is None:
+                    dpi = cls.read_exif_dpi(exif) if exif else (72, 72)
+                return {
+                    "format": 'JPEG',
+                    "width": width,
+                    "height": height,
+                    "mode": {1: 'L', 3: 'RGB', 4: 'CMYK'}.get(components, 'Unknown'),
+                    "dpi": dpi,
+                    "compression": 'No info',
+                    "additional_info": cls.get_exif_info(exif)
+                }
+            elif marker == 0xDA:
+                return None
+            offset += 2 + length
+        return None
+
+    @staticmethod
+    def read_exif_ifd0(exif):
+        tiff = exif[6:]
+        if not exif.startswith(b'Exif\x00\x00') or tiff[:2] not in (b'II', b'MM'):
+            raise struct.error("not an EXIF block")
+        byte_order = '<' if tiff[:2] == b'II' else '>'
+        ifd_offset = struct.unpack(byte_order + 'I', tiff[4:8])[0]
+        field_count = struct.unpack(byte_order + 'H', tiff[ifd_offset:ifd_offset + 2])[0]
+        return tiff, byte_order, ifd_offset, field_count
+
+    @classmethod
+    def read_exif_dpi(cls, exif):
+        try:
+            tiff, byte_order, ifd_offset, field_count = cls.read_exif_ifd0(exif)
+            fields = {}
+            for i in range(field_count):
+                entry = tiff[ifd_offset + 2 + i * 12:ifd_offset + 14 + i * 12]
+                tag, _, _, value = struct.unpack(byte_order + 'HHI4s', entry)
+                fields[tag] = value
+            resolution_unit = struct.unpack(byte_order + 'H', fields[0x0128][:2])[0]
+            resolution_offset = struct.unpack(byte_order + 'I', fields[0x011A])[0]
+            numerator, denominator = struct.unpack(byte_order + 'II',
+                                                   tiff[resolution_offset:resolution_offset + 8])
+            dpi = numerator / denominator
+        except (struct.error, KeyError, ZeroDivisionError):
+            return (72, 72)
+        if resolution_unit == 3:
+            dpi *= 2.54
+        return (dpi, dpi)
+
+    @staticmethod
+    def read_gif_header(head):
+        width, height, flags = struct.unpack('<HHB', head[6:11])
+        if not flags & 0x80:
+            return None
+        palette_size = 2 << (flags & 7)
+        palette = head[13:13 + palette_size * 3]
+        if len(palette) < palette_size * 3:
+            return None
+        if all(palette[i] == palette[i + 1] == palette[i + 2] == i // 3 for i in range(0, len(palette), 3)):
+            return None
+        return {
+            "format": 'GIF',
+            "width": width,
+            "height": height,
+            "mode": 'P',
+            "dpi": (72, 72),
+            "compression": 'No info',
+            "additional_info": f"Palette colors: {palette_size}"
+        }
+
+    @staticmethod
+    def read_bmp_header(head):
+        header_size = struct.unpack('<I', head[14:18])[0]
+        if header_size not in (40, 108, 124):
+            return None
+        width, height, _, bits, compression = struct.unpack('<iiHHI', head[18:34])
+        if compression != 0 or bits not in (16, 24, 32):
+            return None
+        pixels_per_meter = struct.unpack('<ii', head[38:46])
+        return {
+            "format": 'BMP',
+            "width": width,
+            "height": abs(height),
+            "mode": 'RGB',
+            "dpi": tuple(x / 39.3701 for x in pixels_per_meter),
+            "compression": compression,
+            "additional_info": ""
+        }
+
+    @staticmethod
+    def get_thumbnail_bytes(data):
+        data.seek(0)
+        with Image.open(data) as img:
+            img.draft('RGB', THUMBNAIL_SIZE)
+            img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.BILINEAR)
+            buffer = io.BytesIO()
+            if img.mode in ('RGB', 'L'):
+                img.save(buffer, 'JPEG', quality=70)
+            else:
+                img.convert('RGBA').save(buffer, 'PNG')
+            return buffer.getvalue()
 
     @staticmethod
     def get_color_depth(mode):
@@ -60,22 +407,47 @@ class ImageAnalyzerThread(QThread):
         return mode_depths.get(mode, "Unknown")
 
     @staticmethod
-    def get_file_hash(file_path):
-        with open(file_path, "rb") as f:
-            return hashlib.md5(f.read()).hexdigest()
+    def get_file_hash(data):
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    @staticmethod
+    def get_fast_file_hash(data):
+        file_hash = hashlib.blake2b(digest_size=16)
+        file_size = len(data)
+        file_hash.update(file_size.to_bytes(8, "little"))
+        for offset in (0, file_size // 2, max(0, file_size - FAST_HASH_SAMPLE_SIZE)):
+            file_hash.update(data[offset:offset + FAST_HASH_SAMPLE_SIZE])
+        return file_hash.hexdigest()
+
+    @classmethod
+    def get_exif_info(cls, exif):
+        if not exif:
+            return "No EXIF data"
+        try:
+            field_count = cls.read_exif_ifd0(exif)[3]
+        except struct.error:
+            return "No EXIF data"
+        return f"EXIF data: {field_count} fields"
+
+    @staticmethod
+    def get_png_colors(color_type, bit_depth, palette_size):
+        if color_type == 3:
+            return f"Colors: {palette_size}"
+        if color_type in (0, 4):
+            return f"Colors: up to {2 ** bit_depth}"
+        return "Colors: More than 256"
 
     @staticmethod
     def get_additional_info(img, format):
         if format == 'JPEG':
-            try:
-                exif_dict = piexif.load(img.info["exif"])
-                return f"EXIF data: {len(exif_dict['0th'])} fields"
-            except:
-                return "No EXIF data"
+            return ImageAnalyzerThread.get_exif_info(img.info.get("exif"))
         elif format == 'GIF':
-            return f"Palette colors: {len(img.getcolors())}"
+            return f"Palette colors: {len(img.palette.palette) // 3 if img.palette else 0}"
         elif format == 'PNG':
-            return f"Colors: {len(img.getcolors()) if img.getcolors() else 'More than 256'}"
+            rawmode = img.tile[0][3] if img.tile else None
+            bit_depth, color_type = PNG_RAWMODES.get(rawmode, (8, 3 if img.mode == 'P' else 2))
+            palette_size = len(img.palette.palette) // 3 if img.mode == 'P' else 0
+            return ImageAnalyzerThread.get_png_colors(color_type, bit_depth, palette_size)
         return ""
 
 
@@ -92,7 +464,8 @@ class ImageAnalyzer(QMainWindow):
         self.create_themes()
         self.create_ui()
         self.set_theme("Cyberpunk")
-        self.file_paths = {}
+        self.thumbnail_cache = {}
+        self.thumbnail_data = {}
 
     def create_themes(self):
         self.themes = {
@@ -141,6 +514,8 @@ class ImageAnalyzer(QMainWindow):
                 "progress_color": "#669BBC"
             }
         }
+        self.stylesheets = {name: self.build_stylesheet(theme) for name, theme in self.themes.items()}
+        self.current_theme = None
 
     def create_ui(self):
         top_panel = QHBoxLayout()
@@ -155,12 +530,16 @@ class ImageAnalyzer(QMainWindow):
         self.theme_selector.addItems(["Cyberpunk", "Nordic", "Minimalist", "Retro"])
         self.theme_selector.currentTextChanged.connect(self.set_theme)
 
+        self.fast_hash_checkbox = QCheckBox("Fast Hash")
+        self.fast_hash_checkbox.setToolTip("Hash only the file size and a few sampled blocks instead of the whole file")
+
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
 
         top_panel.addWidget(self.select_folder_button)
         top_panel.addWidget(self.select_file_button)
         top_panel.addWidget(self.theme_selector)
+        top_panel.addWidget(self.fast_hash_checkbox)
         top_panel.addWidget(self.progress_bar)
 
         splitter = QSplitter(Qt.Orientation.Horizontal)
@@ -169,7 +548,7 @@ class ImageAnalyzer(QMainWindow):
         self.table.setColumnCount(12)
         self.table.setHorizontalHeaderLabels([
             "Filename", "Dimensions", "Resolution", "Color Depth", "Compression",
-            "Format", "Additional Info", "File Size (MB)", "MD5 Hash",
+            "Format", "Additional Info", "File Size (MB)", "BLAKE2 Hash",
             "Creation Time", "Modification Time", "Last Access Time"
         ])
         self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
@@ -196,8 +575,14 @@ class ImageAnalyzer(QMainWindow):
         self.layout.addWidget(splitter)
 
     def set_theme(self, theme_name):
-        theme = self.themes[theme_name]
-        self.setStyleSheet(f"""
+        if theme_name == self.current_theme:
+            return
+        self.setStyleSheet(self.stylesheets[theme_name])
+        self.current_theme = theme_name
+
+    @staticmethod
+    def build_stylesheet(theme):
+        return f"""
             QWidget {{
                 background-color: {theme['bg']};
                 color: {theme['fg']};
@@ -284,19 +669,29 @@ class ImageAnalyzer(QMainWindow):
                 background-color: {theme['fg']}40;
                 width: 2px;
             }}
-        """)
+        """
 
     def select_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder")
         if folder:
             self.progress_bar.setVisible(True)
             self.table.setRowCount(0)
-            self.file_paths.clear()
-            self.thread = ImageAnalyzerThread([os.path.join(folder, f) for f in os.listdir(folder)
-                                               if f.lower().endswith(
-                    ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.pcx'))])
+            self.thumbnail_cache.clear()
+            self.thumbnail_data.clear()
+            file_paths = []
+            file_stats = {}
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS and entry.is_file():
+                        file_paths.append(entry.path)
+                        try:
+                            file_stats[entry.path] = entry.stat()
+                        except OSError:
+                            pass
+            self.thread = ImageAnalyzerThread(file_paths, self.fast_hash_checkbox.isChecked(), file_stats)
             self.thread.update_progress.connect(self.update_progress)
-            self.thread.update_table.connect(self.update_table)
+            self.thread.update_table_batch.connect(self.update_table)
+            self.thread.files_skipped.connect(self.show_skipped_files)
             self.thread.finished.connect(lambda: self.progress_bar.setVisible(False))
             self.thread.start()
 
@@ -306,33 +701,47 @@ class ImageAnalyzer(QMainWindow):
         if file_paths:
             self.progress_bar.setVisible(True)
             self.table.setRowCount(0)
-            self.file_paths.clear()
-            self.thread = ImageAnalyzerThread(file_paths)
+            self.thumbnail_cache.clear()
+            self.thumbnail_data.clear()
+            self.thread = ImageAnalyzerThread(file_paths, self.fast_hash_checkbox.isChecked())
             self.thread.update_progress.connect(self.update_progress)
-            self.thread.update_table.connect(self.update_table)
+            self.thread.update_table_batch.connect(self.update_table)
+            self.thread.files_skipped.connect(self.show_skipped_files)
             self.thread.finished.connect(lambda: self.progress_bar.setVisible(False))
             self.thread.start()
 
+    def show_skipped_files(self, count):
+        QMessageBox.warning(self, "Image Analyzer",
+                            f"{count} files could not be analyzed because the worker processes stopped.")
+
     def update_progress(self, value):
         self.progress_bar.setValue(value)
 
-    def update_table(self, data):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        for i, value in enumerate(data[:-1]):
-            self.table.setItem(row, i, QTableWidgetItem(str(value)))
-        self.file_paths[row] = data[-1]
+    def update_table(self, rows):
+        self.table.setSortingEnabled(False)
+        self.table.setUpdatesEnabled(False)
+        base_row = self.table.rowCount()
+        self.table.setRowCount(base_row + len(rows))
+        for row, data in enumerate(rows, base_row):
+            file_path, thumbnail = data[12:]
+            for i, value in enumerate(data[:12]):
+                item = QTableWidgetItem()
+                item.setData(Qt.ItemDataRole.DisplayRole, value if isinstance(value, (int, float)) else str(value))
+                self.table.setItem(row, i, item)
+            self.table.item(row, 0).setData(Qt.ItemDataRole.UserRole, file_path)
+            if thumbnail:
+                self.thumbnail_data[file_path] = thumbnail
+        self.table.setUpdatesEnabled(True)
+        self.table.setSortingEnabled(True)
 
     def show_image(self):
         selected_items = self.table.selectedItems()
         if selected_items:
-            file_path = self.file_paths[selected_items[0].row()]
+            file_path = self.table.item(selected_items[0].row(), 0).data(Qt.ItemDataRole.UserRole)
             try:
-                pixmap = QPixmap(file_path)
+                pixmap = self.get_thumbnail(file_path)
                 if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio,
-                                                  Qt.TransformationMode.SmoothTransformation)
-                    self.image_label.setPixmap(scaled_pixmap)
+                    self.image_label.setPixmap(pixmap)
                 else:
                     self.image_label.setText("Unable to load image")
 
@@ -346,8 +755,40 @@ class ImageAnalyzer(QMainWindow):
                 print(f"Error displaying image: {e}")
                 self.image_label.setText("Error displaying image")
 
+    def get_thumbnail(self, file_path):
+        pixmap = self.thumbnail_cache.get(file_path)
+        if pixmap is None and file_path in self.thumbnail_data:
+            pixmap = QPixmap()
+            pixmap.loadFromData(self.thumbnail_data[file_path])
+            self.thumbnail_cache[file_path] = pixmap
+        if pixmap is None:
+            try:
+                with Image.open(file_path) as img:
+                    img.draft('RGB', THUMBNAIL_SIZE)
+                    img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.BILINEAR)
+                    if img.mode not in ('RGB', 'RGBA'):
+                        img = img.convert('RGBA')
+                    pixmap = QPixmap.fromImage(ImageQt.ImageQt(img))
+            except OSError as e:
+                print(f"Error creating thumbnail for {file_path}: {e}")
+                pixmap = self.scale_pixmap(QPixmap(file_path))
+            self.thumbnail_cache[file_path] = pixmap
+        return pixmap
+
+    @staticmethod
+    def scale_pixmap(pixmap):
+        if pixmap.isNull():
+            return pixmap
+        width, height = THUMBNAIL_SIZE
+        if max(pixmap.width(), pixmap.height()) > 4 * max(width, height):
+            pixmap = pixmap.scaled(4 * width, 4 * height, Qt.AspectRatioMode.KeepAspectRatio,
+                                   Qt.TransformationMode.FastTransformation)
+        return pixmap.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = ImageAnalyzer()
     window.show()